@@ -6,10 +6,39 @@ Singleton class that handles theme loading, switching, and stylesheet generation
 import json
 import os
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List
 from PySide6.QtCore import QObject, Signal
 
 
+# Marks a missing theme key, so stored None/falsy values stay distinguishable
+_MISSING = object()
+
+# Fallback colors used when a theme lacks a section. Built once at import
+# rather than per call, since widgets query these on every style refresh.
+# Treat as read-only.
+_PROFILE_CARD_DEFAULTS = {
+    'normal': {'background': '#44475c', 'border': '#6f779a'},
+    'hovered': {'background': '#3a3d4d', 'border': '#8b95c0'},
+    'selected': {'background': '#2d2f3f', 'border': '#BB86FC'}
+}
+
+_PROFILE_GRID_DEFAULTS = {
+    'background': '#282a36',
+    'border': '#44475c',
+    'title_size': 16,
+    'scrollbar': {
+        'background': '#1d1f28',
+        'handle': '#6f779a'
+    }
+}
+
+_IMAGE_PREVIEW_DEFAULTS = {
+    'background': '#282a36',
+    'border_active': '#BB86FC',
+    'border_inactive': '#6f779a'
+}
+
+
 class ThemeManager(QObject):
     """Manages application themes and provides stylesheet generation"""
     
@@ -43,6 +72,14 @@ class ThemeManager(QObject):
         self.current_theme: Optional[Dict] = None
         self.current_theme_name: str = ""
         
+        # Theme-derived caches, cleared on every theme change (including live
+        # editor previews that mutate current_theme in place)
+        self._lookup_cache: Dict[tuple, object] = {}  # (root, path) -> value
+        self._qss_cache: Dict[str, str] = {}  # component key -> stylesheet
+        
+        # Connected first so caches are cleared before any widget slot runs
+        self.theme_changed.connect(self._on_theme_changed)
+        
         # Load themes
         self._load_default_themes()
         self._load_user_themes()
@@ -75,6 +112,11 @@ class ThemeManager(QObject):
             except Exception as e:
                 print(f"Error loading user theme {theme_file}: {e}")
     
+    def _on_theme_changed(self, theme_name: str):
+        """Invalidate theme-derived caches"""
+        self._lookup_cache.clear()
+        self._qss_cache.clear()
+    
     def get_all_themes(self) -> List[str]:
         """Get list of all available theme names"""
         return list(self.default_themes.keys()) + list(self.user_themes.keys())
@@ -162,14 +204,31 @@ class ThemeManager(QObject):
         text_disabled = theme['text']['disabled']
         
         accent_primary = theme['accents']['primary']
+        accent_error = theme['accents'].get('error', '#ff4444')
         border_active = theme['borders']['active']
         border_inactive = theme['borders']['inactive']
         
+        # Profile grid colors (ProfileGrid is styled here rather than per instance)
+        grid_colors = self.get_profile_grid_colors()
+        grid_bg = grid_colors['background']
+        grid_border = grid_colors['border']
+        grid_title_size = grid_colors['title_size']
+        grid_scrollbar_bg = grid_colors['scrollbar']['background']
+        grid_scrollbar_handle = grid_colors['scrollbar']['handle']
+        
         # Extract style values
         btn_radius = styles.get('buttons', {}).get('border_radius', 4)
         btn_pad_h = styles.get('buttons', {}).get('padding_horizontal', 12)
         btn_pad_v = styles.get('buttons', {}).get('padding_vertical', 6)
         
+        input_styles = styles.get('inputs', {})
+        input_radius = input_styles.get('border_radius', 4)
+        input_pad_h = input_styles.get('padding_horizontal', 8)
+        input_pad_v = input_styles.get('padding_vertical', 4)
+        input_focus = input_styles.get('focus_border_width', 2)
+        card_styles = styles.get('cards', {})
+        label_font_size = styles.get('labels', {}).get('font_size', 9)
+        
         # Generate button styles
         button_styles = ""
         
@@ -234,6 +293,27 @@ class ThemeManager(QObject):
             }}
             """
         
+        # Generate profile card styles for every card type and state;
+        # ProfileItem selects them via its "card_type" and "state" properties.
+        # The #profileGridContainer selector outranks that container's
+        # QWidget background rule for cards inside a grid.
+        card_radius = card_styles.get('border_radius', 4)
+        card_border = card_styles.get('border_width', 2)
+        card_item_styles = ""
+        for card_type in dict.fromkeys(('neutral', 'success', 'danger', *theme.get('profile_cards', {}))):
+            card_colors = self.get_profile_card_colors(card_type)
+            for state in ('normal', 'hovered', 'selected'):
+                selector = f'ProfileItem[card_type="{card_type}"][state="{state}"]'
+                card_item_styles += f"""
+            {selector}, QWidget#profileGridContainer {selector} {{
+                background-color: {card_colors[state]['background']};
+                border: {3 if state == 'selected' else card_border}px solid {card_colors[state]['border']};
+                border-radius: {card_radius}px;
+                color: {text_primary};
+                font-size: {label_font_size}pt;
+            }}
+            """
+        
         # Build stylesheet
         stylesheet = f"""
         QMainWindow {{
@@ -350,41 +430,280 @@ class ThemeManager(QObject):
         QScrollBar::handle:vertical:hover {{
             background-color: {border_active};
         }}
+        
+        /* Profile grid */
+        ProfileGrid {{
+            background-color: {grid_bg};
+            border: 1px solid {grid_border};
+            border-radius: 4px;
+        }}
+        
+        QWidget#profileGridContainer, QWidget#profileGridContainer QWidget {{
+            background-color: {grid_bg};
+        }}
+        
+        QLabel#profileGridTitle {{
+            color: {text_primary};
+            background: transparent;
+            font-size: {grid_title_size}px;
+            font-weight: bold;
+            padding: 10px;
+        }}
+        
+        ProfileGrid QScrollBar:vertical {{
+            background-color: {grid_scrollbar_bg};
+            width: 12px;
+            margin: 0px;
+        }}
+        
+        ProfileGrid QScrollBar::handle:vertical {{
+            background-color: {grid_scrollbar_handle};
+            min-height: 20px;
+            border-radius: 6px;
+        }}
+        
+        ProfileGrid QScrollBar::add-line:vertical, ProfileGrid QScrollBar::sub-line:vertical {{
+            height: 0px;
+        }}
+        
+        ProfileGrid QScrollBar:horizontal {{
+            background-color: {grid_scrollbar_bg};
+            height: 12px;
+            margin: 0px;
+        }}
+        
+        ProfileGrid QScrollBar::handle:horizontal {{
+            background-color: {grid_scrollbar_handle};
+            min-width: 20px;
+            border-radius: 6px;
+        }}
+        
+        ProfileGrid QScrollBar::add-line:horizontal, ProfileGrid QScrollBar::sub-line:horizontal {{
+            width: 0px;
+        }}
+        
+        /* Profile cards */
+        {card_item_styles}
+        
+        /* Themed widgets (ui/widgets/themed_widgets.py) are styled here by
+           class name rather than per instance; ThemedButton uses the
+           QPushButton[class="..."] rules above via its "class" property */
+        ThemedLineEdit {{
+            background-color: {bg_input};
+            color: {text_primary};
+            border: 1px solid {border_inactive};
+            border-radius: {input_radius}px;
+            padding: {input_pad_v}px {input_pad_h}px;
+        }}
+        
+        ThemedLineEdit:focus {{
+            border: {input_focus}px solid {border_active};
+        }}
+        
+        ThemedLineEdit:disabled {{
+            background-color: {bg_tertiary};
+            color: {text_disabled};
+        }}
+        
+        ErrorLineEdit[error="true"], ErrorLineEdit[error="true"]:focus {{
+            border: 2px solid {accent_error};
+        }}
+        
+        ThemedTextEdit {{
+            background-color: {bg_input};
+            color: {text_primary};
+            border: 1px solid {border_inactive};
+            border-radius: {input_radius}px;
+            padding: {input_pad_v}px;
+        }}
+        
+        ThemedTextEdit:focus {{
+            border: {input_focus}px solid {border_active};
+        }}
+        
+        ThemedSpinBox, ThemedDoubleSpinBox {{
+            background-color: {bg_input};
+            color: {text_primary};
+            border: 1px solid {border_inactive};
+            border-radius: {input_radius}px;
+            padding: {input_pad_v}px {input_pad_h}px;
+        }}
+        
+        ThemedSpinBox:focus, ThemedDoubleSpinBox:focus {{
+            border: {input_focus}px solid {border_active};
+        }}
+        
+        ThemedSpinBox::up-button, ThemedSpinBox::down-button,
+        ThemedDoubleSpinBox::up-button, ThemedDoubleSpinBox::down-button {{
+            background-color: {bg_tertiary};
+            border: none;
+            width: 16px;
+        }}
+        
+        ThemedSpinBox::up-button:hover, ThemedSpinBox::down-button:hover,
+        ThemedDoubleSpinBox::up-button:hover, ThemedDoubleSpinBox::down-button:hover {{
+            background-color: {bg_secondary};
+        }}
+        
+        ThemedGroupBox {{
+            border: 2px solid {border_inactive};
+            border-radius: {card_styles.get('border_radius', 8)}px;
+            margin-top: 12px;
+            padding: {card_styles.get('padding', 10)}px;
+            background-color: {bg_secondary};
+            color: {text_primary};
+            font-weight: bold;
+        }}
+        
+        ThemedGroupBox::title {{
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 5px 0 5px;
+        }}
+        
+        ThemedLabel {{
+            color: {text_primary};
+            background: transparent;
+            font-size: {label_font_size}pt;
+        }}
+        
+        ThemedLabel[variant="title"] {{
+            font-weight: bold;
+            padding: 5px;
+        }}
+        
+        ThemedCheckBox, ThemedRadioButton {{
+            color: {text_primary};
+            spacing: 5px;
+        }}
+        
+        ThemedCheckBox::indicator, ThemedRadioButton::indicator {{
+            width: 16px;
+            height: 16px;
+            border: 1px solid {border_inactive};
+            border-radius: 3px;
+            background-color: {bg_input};
+        }}
+        
+        ThemedRadioButton::indicator {{
+            border-radius: 8px;
+        }}
+        
+        ThemedCheckBox::indicator:checked, ThemedRadioButton::indicator:checked {{
+            background-color: {accent_primary};
+            border-color: {accent_primary};
+        }}
+        
+        ThemedCheckBox::indicator:hover, ThemedRadioButton::indicator:hover {{
+            border-color: {border_active};
+        }}
+        
+        GroupedAutoWidget QCheckBox {{
+            font-weight: bold;
+            color: #4a90e2;
+        }}
+        
+        ThemedScrollArea {{
+            background-color: {bg_secondary};
+            border: 1px solid {border_inactive};
+        }}
+        
+        ThemedSplitter::handle {{
+            background-color: {border_inactive};
+        }}
+        
+        ThemedSplitter::handle:hover {{
+            background-color: {border_active};
+        }}
+        
+        ThemedListWidget {{
+            background-color: {bg_input};
+            color: {text_primary};
+            border: 1px solid {border_inactive};
+            border-radius: 4px;
+        }}
+        
+        ThemedListWidget::item {{
+            padding: 5px;
+        }}
+        
+        ThemedListWidget::item:selected {{
+            background-color: {accent_primary};
+            color: {text_primary};
+        }}
+        
+        ThemedListWidget::item:hover {{
+            background-color: {bg_secondary};
+        }}
+        
+        ThemedMenu {{
+            background-color: {bg_secondary};
+            color: {text_primary};
+            border: 1px solid {border_inactive};
+        }}
+        
+        ThemedMenu::item {{
+            padding: 5px 20px;
+        }}
+        
+        ThemedMenu::item:selected {{
+            background-color: {accent_primary};
+        }}
         """
         
         return stylesheet
     
-    def get_color(self, path: str) -> str:
-        """Get a color value from current theme by path (e.g., 'backgrounds.primary')"""
-        if not self.current_theme:
-            return "#000000"
+    def get_compiled_qss(self, component_key: str, builder: Callable[['ThemeManager'], str]) -> str:
+        """
+        Get the stylesheet for a component, built once per theme.
+        builder(theme_manager) assembles it on the first request after a
+        theme change; every widget of that component then shares the string.
+        """
+        qss = self._qss_cache.get(component_key)
+        if qss is None:
+            qss = self._qss_cache[component_key] = builder(self)
+        return qss
+    
+    def _lookup(self, root_key: Optional[str], path: str):
+        """
+        Resolve a dotted path in the current theme (under root_key if given).
+        Results are memoized until the next theme change; returns _MISSING
+        if any part of the path does not exist.
+        """
+        cache_key = (root_key, path)
+        value = self._lookup_cache.get(cache_key, _MISSING)
+        if value is not _MISSING or cache_key in self._lookup_cache:
+            return value
         
-        parts = path.split('.')
         value = self.current_theme
+        if root_key is not None:
+            value = value.get(root_key, _MISSING)
         
-        for part in parts:
+        for part in path.split('.'):
             if isinstance(value, dict) and part in value:
                 value = value[part]
             else:
-                return "#000000"
+                value = _MISSING
+                break
         
+        self._lookup_cache[cache_key] = value
         return value
     
-    def get_style(self, path: str):
-        """Get a style value from current theme's control styles by path (e.g., 'buttons.border_radius')"""
-        if not self.current_theme or 'control_styles' not in self.current_theme:
-            return None
-        
-        parts = path.split('.')
-        value = self.current_theme['control_styles']
+    def get_color(self, path: str, default: str = "#000000") -> str:
+        """Get a color value from current theme by path (e.g., 'backgrounds.primary')"""
+        if not self.current_theme:
+            return default
         
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                return None
+        value = self._lookup(None, path)
+        return default if value is _MISSING else value
+    
+    def get_style(self, path: str, default=None):
+        """Get a style value from current theme's control styles by path (e.g., 'buttons.border_radius')"""
+        if not self.current_theme:
+            return default
         
-        return value
+        value = self._lookup('control_styles', path)
+        return default if value is _MISSING else value
     
     def get_profile_card_colors(self, card_type: str = "neutral"):
         """
@@ -393,11 +712,7 @@ class ThemeManager(QObject):
         """
         if not self.current_theme or 'profile_cards' not in self.current_theme:
             # Fallback to default colors
-            return {
-                'normal': {'background': '#44475c', 'border': '#6f779a'},
-                'hovered': {'background': '#3a3d4d', 'border': '#8b95c0'},
-                'selected': {'background': '#2d2f3f', 'border': '#BB86FC'}
-            }
+            return _PROFILE_CARD_DEFAULTS
         
         cards = self.current_theme['profile_cards']
         if card_type not in cards:
@@ -409,15 +724,7 @@ class ThemeManager(QObject):
         """Get profile grid colors (background, border, scrollbar)"""
         if not self.current_theme or 'profile_grid' not in self.current_theme:
             # Fallback to default colors
-            return {
-                'background': '#282a36',
-                'border': '#44475c',
-                'title_size': 16,
-                'scrollbar': {
-                    'background': '#1d1f28',
-                    'handle': '#6f779a'
-                }
-            }
+            return _PROFILE_GRID_DEFAULTS
         
         return self.current_theme['profile_grid']
     
@@ -425,11 +732,7 @@ class ThemeManager(QObject):
         """Get image preview colors (background, borders)"""
         if not self.current_theme or 'image_preview' not in self.current_theme:
             # Fallback to default colors
-            return {
-                'background': '#282a36',
-                'border_active': '#BB86FC',
-                'border_inactive': '#6f779a'
-            }
+            return _IMAGE_PREVIEW_DEFAULTS
         
         return self.current_theme['image_preview']
 
@@ -4,6 +4,7 @@ PyPortalMill - Main Application Entry Point
 
 import sys
 from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QPixmapCache
 from ui.main_window import MainWindow
 
 
@@ -16,6 +17,9 @@ def main():
     app.setOrganizationName("PyPortalMill")
     app.setStyle("Fusion")
     
+    # Room for decoded profile images and placeholders (KB)
+    QPixmapCache.setCacheLimit(64 * 1024)
+    
     # Initialize Coordinator
     # (Lazy import to avoid circular dependencies if any, though likely fine here)
     from core.app_coordinator import AppCoordinator
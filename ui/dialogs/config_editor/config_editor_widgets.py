@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import (QTreeWidget, QTreeWidgetItem, QWidget, QFormLayout, 
                                QLineEdit, QSpinBox, QDoubleSpinBox, QCheckBox, 
                                QComboBox, QLabel, QVBoxLayout, QGroupBox, QPushButton, QColorDialog)
-from PySide6.QtCore import Qt, Signal, QMimeData
+from PySide6.QtCore import Qt, Signal, QMimeData, QTimer
 from PySide6.QtGui import QDrag, QAction, QColor
 
 class DraggableTreeWidget(QTreeWidget):
@@ -50,8 +50,23 @@ class PropertiesEditor(QWidget):
         self.current_obj = None
         self.form_layout = None
         
+        # Edits fire per keystroke and each refresh walks every tree and
+        # redraws the preview, so a burst of typing emits data_changed once
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(150)
+        self._emit_timer.timeout.connect(self.data_changed.emit)
+        
+    def flush(self):
+        """Emit a pending data_changed now instead of after the delay"""
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self.data_changed.emit()
+        
     def edit_object(self, obj, obj_type):
         """Build form for the object"""
+        # Apply the previous object's pending edit before switching forms
+        self.flush()
         self.current_obj = obj
         
         # Clear previous
@@ -203,4 +218,4 @@ class PropertiesEditor(QWidget):
 
     def _update_attr(self, obj, attr, value):
         setattr(obj, attr, value)
-        self.data_changed.emit()
+        self._emit_timer.start()
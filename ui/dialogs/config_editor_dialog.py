@@ -8,7 +8,7 @@ import json
 from dataclasses import asdict
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
                                QLabel, QLineEdit, QMessageBox, QComboBox, 
-                               QTreeWidget, QTreeWidgetItem, QSplitter, QTreeWidgetItemIterator,
+                               QTreeWidget, QTreeWidgetItem, QSplitter,
                                QWidget, QListWidget, QTabWidget, QToolBar, QMenu,
                                QGraphicsView, QGraphicsScene, QGraphicsRectItem, QGraphicsEllipseItem)
 from PySide6.QtCore import Qt, QRectF
@@ -31,6 +31,7 @@ class ConfigEditorDialog(QDialog):
         
         self.setWindowTitle("Config Editor" if mode == 'create' else f"Edit Config: {config_name}")
         self.setMinimumSize(1200, 800)
+        self._tree_labels = []
         
         self._load_data()
         self._setup_ui()
@@ -271,8 +272,8 @@ class ConfigEditorDialog(QDialog):
         
     def _populate_tabs(self):
         self.tab_list.clear()
-        for tab in self.tabs:
-            self.tab_list.addItem(tab.name)
+        # One batched insert instead of a row-insert + relayout per tab
+        self.tab_list.addItems([tab.name for tab in self.tabs])
             
         if self.tabs:
             self.tab_list.setCurrentRow(0)
@@ -293,41 +294,63 @@ class ConfigEditorDialog(QDialog):
         tab = self._get_current_tab()
         if not tab: return
         
+        # Suspend painting while the lists and trees are rebuilt so Qt does
+        # one layout/paint pass instead of one per inserted row
+        views = (self.profile_list, self.left_tree, self.right_tree, self.preview_tree)
+        for view in views:
+            view.setUpdatesEnabled(False)
+        try:
+            self._fill_workspace(tab)
+        finally:
+            for view in views:
+                view.setUpdatesEnabled(True)
+            
+        self._draw_preview_shapes()
+
+    def _fill_workspace(self, tab):
         # Profiles
         self.profile_list.clear()
-        for p in tab.profiles:
-             self.profile_list.addItem(p.name)
+        self.profile_list.addItems([p.name for p in tab.profiles])
              
         # Layout Trees
         self.left_tree.clear()
         self.right_tree.clear()
+        left_roots, right_roots = [], []
+        # (item, obj, label attr) for every tree row, so _refresh_ui can
+        # relabel without walking the trees and reading item data back
+        self._tree_labels = []
         
         for section in tab.parameter_sections:
             root = QTreeWidgetItem([section.title])
             root.setData(0, Qt.UserRole, "section")
             root.setData(0, Qt.UserRole + 1, section) # Store object
+            self._tree_labels.append((root, section, 'title'))
             
             for param in section.parameters:
                 child = QTreeWidgetItem([param.name])
                 child.setData(0, Qt.UserRole, "parameter")
                 child.setData(0, Qt.UserRole + 1, param)
+                self._tree_labels.append((child, param, 'name'))
                 root.addChild(child)
                 
+            (left_roots if section.position == "left" else right_roots).append(root)
+            
+        self.left_tree.addTopLevelItems(left_roots)
+        self.right_tree.addTopLevelItems(right_roots)
+        # Expansion only takes effect once the item is in a tree
+        for root in left_roots + right_roots:
             root.setExpanded(True)
-            if section.position == "left":
-                self.left_tree.addTopLevelItem(root)
-            else:
-                self.right_tree.addTopLevelItem(root)
 
         # Preview Shapes
         self.preview_tree.clear()
-        for shape in tab.preview:
-            item = QTreeWidgetItem([shape.id])
-            item.setData(0, Qt.UserRole, "preview_shape")
-            item.setData(0, Qt.UserRole + 1, shape)
-            self.preview_tree.addTopLevelItem(item)
-            
-        self._draw_preview_shapes()
+        self.preview_tree.addTopLevelItems([self._make_shape_item(shape) for shape in tab.preview])
+
+    def _make_shape_item(self, shape):
+        item = QTreeWidgetItem([shape.id])
+        item.setData(0, Qt.UserRole, "preview_shape")
+        item.setData(0, Qt.UserRole + 1, shape)
+        self._tree_labels.append((item, shape, 'id'))
+        return item
 
     def _on_profile_selected(self, item):
         tab = self._get_current_tab()
@@ -352,24 +375,26 @@ class ConfigEditorDialog(QDialog):
         tab = self._get_current_tab()
         if not tab: return
         
-        # Update Tab Name in list
-        if self.tab_list.currentItem().text() != tab.name:
-             self.tab_list.currentItem().setText(tab.name)
+        # Update Tab Names in list - all of them, since a delayed refresh
+        # can arrive after the edited tab is no longer the current one
+        item = self.tab_list.item
+        for i, list_tab in enumerate(self.tabs):
+            row = item(i)
+            if row.text() != list_tab.name:
+                row.setText(list_tab.name)
              
         # Update Profile List Names
-        for i in range(self.profile_list.count()):
-            self.profile_list.item(i).setText(tab.profiles[i].name)
+        item = self.profile_list.item
+        for i, profile in enumerate(tab.profiles):
+            row = item(i)
+            if row.text() != profile.name:
+                row.setText(profile.name)
             
         # Update Tree Names
-        for tree in [self.left_tree, self.right_tree, self.preview_tree]:
-            iterator = QTreeWidgetItemIterator(tree)
-            while iterator.value():
-                item = iterator.value()
-                obj = item.data(0, Qt.UserRole + 1)
-                if hasattr(obj, 'title'): item.setText(0, obj.title)
-                elif hasattr(obj, 'name'): item.setText(0, obj.name)
-                elif hasattr(obj, 'id'): item.setText(0, obj.id)
-                iterator += 1
+        for item, obj, attr in self._tree_labels:
+            label = getattr(obj, attr)
+            if item.text(0) != label:
+                item.setText(0, label)
                 
         # Redraw preview scene
         self._draw_preview_shapes()
@@ -391,28 +416,32 @@ class ConfigEditorDialog(QDialog):
         if tab:
             new_p = ProfileConfig(id=f"p_{len(tab.profiles)+1}", name="New Profile", type="hardware")
             tab.profiles.append(new_p)
-            self._rebuild_workspace()
+            # Single-row changes only touch their own list, not the trees
+            self.profile_list.addItem(new_p.name)
             
     def _del_profile(self):
         tab = self._get_current_tab()
         row = self.profile_list.currentRow()
         if tab and row >= 0:
             del tab.profiles[row]
-            self._rebuild_workspace()
+            self.profile_list.takeItem(row)
 
     def _add_preview_rect(self):
         tab = self._get_current_tab()
         if not tab: return
         shape = PreviewShapeConfig(id=f"rect_{len(tab.preview)}", type="rectangle", x=10, y=10, width=50, height=50, color="#FF0000")
-        tab.preview.append(shape)
-        self._rebuild_workspace()
+        self._append_shape(tab, shape)
         
     def _add_preview_circle(self):
         tab = self._get_current_tab()
         if not tab: return
         shape = PreviewShapeConfig(id=f"circle_{len(tab.preview)}", type="circle", x=60, y=10, width=50, height=50, color="#00FF00")
+        self._append_shape(tab, shape)
+
+    def _append_shape(self, tab, shape):
         tab.preview.append(shape)
-        self._rebuild_workspace()
+        self.preview_tree.addTopLevelItem(self._make_shape_item(shape))
+        self._draw_preview_shapes()
         
     def _del_preview_shape(self):
         item = self.preview_tree.currentItem()
@@ -421,7 +450,9 @@ class ConfigEditorDialog(QDialog):
         tab = self._get_current_tab()
         if shape in tab.preview:
             tab.preview.remove(shape)
-            self._rebuild_workspace()
+            self.preview_tree.takeTopLevelItem(self.preview_tree.indexOfTopLevelItem(item))
+            self._tree_labels = [entry for entry in self._tree_labels if entry[0] is not item]
+            self._draw_preview_shapes()
 
     def _handle_shape_drop(self, target_item, drop_pos):
         tab = self._get_current_tab()
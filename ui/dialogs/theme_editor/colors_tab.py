@@ -362,48 +362,6 @@ class ColorsTab(QWidget):
             }}
         """)
     
-    def _update_previews(self):
-        """Update all preview elements and apply temporary theme"""
-        # Update background preview
-        if 'background' in self.preview_widgets:
-            self.preview_widgets['background'].setStyleSheet(
-                f"background-color: {self._get_color('backgrounds.primary')}; "
-                f"color: {self._get_color('text.primary')}; "
-                f"border: 1px solid {self._get_color('borders.inactive')}; "
-                f"padding: 10px;"
-            )
-        
-        # Update text labels
-        if 'text_labels' in self.preview_widgets:
-            colors = ['text.primary', 'text.secondary', 'text.disabled', 'text.links']
-            for i, label in enumerate(self.preview_widgets['text_labels']):
-                label.setStyleSheet(f"color: {self._get_color(colors[i])}; background: transparent; font-size: 11pt;")
-        
-        # Update accent boxes
-        if 'accent_boxes' in self.preview_widgets:
-            colors = ['accents.primary', 'accents.secondary', 'accents.warning', 'accents.error']
-            for i, box in enumerate(self.preview_widgets['accent_boxes']):
-                box.setStyleSheet(f"background-color: {self._get_color(colors[i])}; color: white; border-radius: 4px;")
-        
-        # Update border previews
-        if 'border_active' in self.preview_widgets:
-            self.preview_widgets['border_active'].setStyleSheet(
-                f"border: 2px solid {self._get_color('borders.active')}; background: transparent;"
-            )
-        if 'border_inactive' in self.preview_widgets:
-            self.preview_widgets['border_inactive'].setStyleSheet(
-                f"border: 2px solid {self._get_color('borders.inactive')}; background: transparent;"
-            )
-        
-        # Update button previews
-        if 'button_previews' in self.preview_widgets:
-            for button_type, buttons in self.preview_widgets['button_previews'].items():
-                self._apply_button_style(buttons['normal'], button_type, 'normal')
-                self._apply_button_style(buttons['disabled'], button_type, 'disabled')
-        
-        # Trigger real-time theme update for the app
-        self.parent_dialog.apply_temporary_theme()
-    
     def _create_profile_cards_section(self, parent_layout):
         """Create profile cards section with card type variants"""
         group = QGroupBox("Profile Cards")
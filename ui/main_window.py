@@ -105,6 +105,13 @@ class MainWindow(QMainWindow):
         theme_editor_action.triggered.connect(self._open_theme_editor)
         select_theme_menu.addAction(theme_editor_action)
         
+        # Store reference for updates
+        self.select_theme_menu = select_theme_menu
+        self.user_theme_actions = []
+        
+        # Populate user themes
+        self._update_user_themes_menu(select_theme_menu)
+        
         # Configuration menu
         config_menu = menubar.addMenu("Configuration")
         
@@ -126,11 +133,28 @@ class MainWindow(QMainWindow):
         # Populate configs
         self._update_config_menu()
 
+    def _update_user_themes_menu(self, menu):
+        """Update user themes in the theme menu"""
+        # Remove old actions
+        for action in self.user_theme_actions:
+            menu.removeAction(action)
+            action.deleteLater()
+        self.user_theme_actions.clear()
+        
+        for theme_name in self.theme_manager.get_user_theme_names():
+            action = QAction(theme_name, self)
+            action.triggered.connect(lambda checked, name=theme_name: self._on_theme_selected(name))
+            
+            # Insert before separator
+            menu.insertAction(self.theme_editor_separator, action)
+            self.user_theme_actions.append(action)
+    
     def _update_config_menu(self):
         """Update configurations in the menu"""
         # Remove old actions
         for action in self.config_actions:
             self.select_config_menu.removeAction(action)
+            action.deleteLater()
         self.config_actions.clear()
         
         # Add available configs
@@ -96,32 +96,6 @@ class DoorsTab(QWidget):
         else:
             self.next_button.setText("Next →")
     
-    def setup_ui(self):
-        """Setup the doors tab UI"""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
-        
-        # Tab widget with 3 tabs
-        self.tab_widget = QTabWidget()
-        self.tab_widget.setTabPosition(QTabWidget.North)  # Tabs at top
-        
-        # Create step widgets
-        self.selection_step = SelectionStep(context=self.context)
-        self.configure_step = ConfigureStep(context=self.context)
-        self.generate_step = GenerateStep(context=self.context)
-        
-        # Add tabs
-        self.tab_widget.addTab(self.selection_step, "1. Profiles/Selection")
-        self.tab_widget.addTab(self.configure_step, "2. Setup/Configure")
-        self.tab_widget.addTab(self.generate_step, "3. Export/Generate")
-        
-        layout.addWidget(self.tab_widget)
-        
-        # Navigation buttons at bottom
-        nav_layout = self.create_navigation()
-        layout.addLayout(nav_layout)
-    
     def create_parameter_panel(self) -> QWidget:
         """Create the parameter panel (placeholder for now)"""
         panel = QWidget()
@@ -143,56 +117,3 @@ class DoorsTab(QWidget):
         layout.addStretch()
         
         return panel
-    
-    def create_navigation(self) -> QHBoxLayout:
-        """Create navigation buttons (Back/Next) - alternative navigation"""
-        nav_layout = QHBoxLayout()
-        nav_layout.setContentsMargins(10, 5, 10, 5)
-        
-        # Back button
-        self.back_button = ThemedButton("← Back", button_type="secondary")
-        nav_layout.addWidget(self.back_button)
-        
-        nav_layout.addStretch()
-        
-        # Next/Finish button
-        self.next_button = ThemedButton("Next →", button_type="primary")
-        nav_layout.addWidget(self.next_button)
-        
-        self.update_navigation_buttons()
-        return nav_layout
-    
-    def connect_signals(self):
-        """Connect signals"""
-        # Back/Next buttons navigate tabs
-        self.back_button.clicked.connect(self.prev_tab)
-        self.next_button.clicked.connect(self.next_tab)
-        
-        # Update buttons when tab changes
-        self.tab_widget.currentChanged.connect(self.update_navigation_buttons)
-    
-    def next_tab(self):
-        """Navigate to next tab"""
-        current = self.tab_widget.currentIndex()
-        if current < self.tab_widget.count() - 1:
-            self.tab_widget.setCurrentIndex(current + 1)
-    
-    def prev_tab(self):
-        """Navigate to previous tab"""
-        current = self.tab_widget.currentIndex()
-        if current > 0:
-            self.tab_widget.setCurrentIndex(current - 1)
-    
-    def update_navigation_buttons(self):
-        """Update navigation button states"""
-        current = self.tab_widget.currentIndex()
-        total = self.tab_widget.count()
-        
-        # Back button disabled on first tab
-        self.back_button.setEnabled(current > 0)
-        
-        # Change Next to Finish on last tab
-        if current == total - 1:
-            self.next_button.setText("Finish ✓")
-        else:
-            self.next_button.setText("Next →")
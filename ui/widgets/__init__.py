@@ -15,7 +15,7 @@ from .themed_widgets import (
 # Simple widgets
 from .simple_widgets import (
     ClickableLabel, ScaledImageLabel, ClickableImageLabel,
-    ScaledPreviewLabel, ErrorLineEdit, PlaceholderPixmap
+    ScaledPreviewLabel, ErrorLineEdit, PlaceholderPixmap, ImageLoader
 )
 
 # Dollar variable widgets  
@@ -42,7 +42,7 @@ __all__ = [
     
     # Simple widgets
     'ClickableLabel', 'ScaledImageLabel', 'ClickableImageLabel',
-    'ScaledPreviewLabel', 'ErrorLineEdit', 'PlaceholderPixmap',
+    'ScaledPreviewLabel', 'ErrorLineEdit', 'PlaceholderPixmap', 'ImageLoader',
     
     # Dollar variable widgets
     'DollarVariableLineEdit', 'DollarVariableSpinBox',
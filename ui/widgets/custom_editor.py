@@ -9,6 +9,10 @@ from PySide6.QtCore import Qt
 from .themed_widgets import ThemedLabel, ThemedScrollArea, ThemedLineEdit
 import re
 
+# Custom variables {name} or {name:default} (not L or $ variables); compiled
+# once, update_customs runs per edit
+_CUSTOM_VAR_RE = re.compile(r'\{([^L$][^:}]*?)(?::([^}]+))?\}')
+
 
 class CustomEditor(QWidget):
     """Resizable custom variable editor"""
@@ -16,18 +20,13 @@ class CustomEditor(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.customs = {}  # var_name -> line_edit
+        self._row_pool = []  # (row, label, line_edit), reused across updates
+        self._last_defaults = None  # var_name -> default of the last update
         
+        # No stylesheet of its own: the rule it used to set never painted
+        # (plain QWidget subclass) and colors don't cascade to the rows, so
+        # the app stylesheet is what styles the editor and its children
         self.setup_ui()
-        self.apply_styling()
-    
-    def apply_styling(self):
-        """Apply Python-based styling"""
-        self.setStyleSheet("""
-            CustomEditor {
-                background-color: #282a36;
-                color: #ffffff;
-            }
-        """)
     
     def setup_ui(self):
         """Setup UI components"""
@@ -35,8 +34,7 @@ class CustomEditor(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Title
-        self.title_label = ThemedLabel("Custom Variables")
-        self.title_label.setStyleSheet("QLabel { font-weight: bold; padding: 5px; }")
+        self.title_label = ThemedLabel("Custom Variables", variant="title")
         layout.addWidget(self.title_label)
         
         # Scroll area - now resizable
@@ -46,28 +44,40 @@ class CustomEditor(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setMinimumHeight(100)  # Minimum height
         
-        # Container
+        # Container - no stylesheet of its own; the global theme's QWidget
+        # rule already paints it (and its rows) in the primary background
         container = QWidget()
-        container.setStyleSheet("QWidget { background-color: #1d1f28; }")
         self.customs_layout = QVBoxLayout(container)
         self.customs_layout.setSpacing(5)
         self.customs_layout.setContentsMargins(5, 5, 5, 5)
+        self.customs_layout.addStretch()  # Rows are inserted above it
         
         scroll.setWidget(container)
         layout.addWidget(scroll, 1)
     
+    def _make_row(self):
+        """Create a custom variable row (label + line edit) and add it to the pool"""
+        row = QWidget()
+        row_layout = QVBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        
+        label = ThemedLabel()
+        row_layout.addWidget(label)
+        
+        # Line edit - supports any content including entire lines
+        line_edit = ThemedLineEdit()
+        line_edit.setPlaceholderText("Enter value or entire line...")
+        row_layout.addWidget(line_edit)
+        
+        self.customs_layout.insertWidget(self.customs_layout.count() - 1, row)
+        entry = (row, label, line_edit)
+        self._row_pool.append(entry)
+        return entry
+    
     def update_customs(self, gcode):
         """Extract custom variables from gcode and update UI"""
-        # Clear existing
-        while self.customs_layout.count():
-            item = self.customs_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self.customs.clear()
-        
         # Find custom variables (not L or $ variables) - parse name:default correctly
-        pattern = r'\{([^L$][^:}]*?)(?::([^}]+))?\}'
-        matches = re.findall(pattern, gcode)
+        matches = _CUSTOM_VAR_RE.findall(gcode)
         
         # Create unique customs
         unique_customs = {}
@@ -75,31 +85,33 @@ class CustomEditor(QWidget):
             if var_name not in unique_customs:
                 unique_customs[var_name] = default
         
-        # Create editors
-        for var_name in sorted(unique_customs.keys()):
-            default = unique_customs[var_name]
-            
-            # Custom widget
-            custom_widget = QWidget()
-            custom_layout = QVBoxLayout(custom_widget)
-            custom_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # Label
-            label = ThemedLabel(f"{var_name}:")
-            custom_layout.addWidget(label)
-            
-            # Line edit - supports any content including entire lines
-            line_edit = ThemedLineEdit()
-            if default:
-                line_edit.setText(default)
-            line_edit.setPlaceholderText("Enter value or entire line...")
-            custom_layout.addWidget(line_edit)
-            
-            self.customs_layout.addWidget(custom_widget)
+        # Most edits don't touch the variables; leave the rows (and any
+        # values typed into them) alone unless a name or default changed
+        if unique_customs == self._last_defaults:
+            return
+        # Variables whose default is unchanged keep what the user typed
+        previous = self._last_defaults or {}
+        values = {name: line_edit.text() for name, line_edit in self.customs.items()
+                  if previous.get(name) == unique_customs.get(name)}
+        self._last_defaults = unique_customs
+        self.customs.clear()
+        
+        # Fill editors. Rows are relabelled in place; this runs per edit, and
+        # rebuilding every widget each time churned hundreds of QObjects
+        var_names = sorted(unique_customs.keys())
+        for index, var_name in enumerate(var_names):
+            if index < len(self._row_pool):
+                row, label, line_edit = self._row_pool[index]
+            else:
+                row, label, line_edit = self._make_row()
+            label.setText(f"{var_name}:")
+            line_edit.setText(values.get(var_name, unique_customs[var_name]))
+            row.show()
             self.customs[var_name] = line_edit
         
-        # Add stretch
-        self.customs_layout.addStretch()
+        # Park rows that are not needed this time
+        for row, _, _ in self._row_pool[len(var_names):]:
+            row.hide()
         
         # Update visibility
         self.setVisible(len(self.customs) > 0)
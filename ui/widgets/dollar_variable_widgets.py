@@ -4,10 +4,8 @@ Dollar Variable Widgets
 Special widgets that automatically sync with main_window dollar variables.
 """
 
-from PySide6.QtWidgets import QSpinBox, QCheckBox, QRadioButton, QButtonGroup
-from PySide6.QtCore import Signal
-from PySide6.QtGui import QDoubleValidator
-from .themed_widgets import ThemedLineEdit, ThemedSpinBox, ThemedCheckBox, ThemedRadioButton
+from PySide6.QtWidgets import QButtonGroup
+from .themed_widgets import ThemedLineEdit, ThemedSpinBox, ThemedCheckBox
 
 
 class DollarVariableLineEdit(ThemedLineEdit):
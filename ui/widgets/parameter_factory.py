@@ -5,9 +5,9 @@ Creates UI widgets based on parameter configuration.
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QDoubleSpinBox, QComboBox, QCheckBox, QGroupBox, QSpinBox)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Signal
 from core.config_manager import ParameterConfig, ParameterSectionConfig, GroupedAutoConfig
-from typing import Dict, Any, List
+from typing import Dict, List
 
 class ParameterWidget(QWidget):
     """Base class for parameter widgets"""
@@ -41,31 +41,45 @@ class ParameterWidget(QWidget):
         self.layout.addWidget(self.input_widget)
         
     def _create_input_widget(self):
-        if self.config.type == "float":
-            w = QDoubleSpinBox()
-            w.setRange(self.config.min_value or 0, self.config.max_value or 99999)
-            w.setValue(float(self.config.default))
-            w.valueChanged.connect(lambda v: self.value_changed.emit(self.config.name, v))
-            return w
-        elif self.config.type == "int":
-            w = QSpinBox()
-            w.setRange(int(self.config.min_value or 0), int(self.config.max_value or 99999))
-            w.setValue(int(self.config.default))
-            w.valueChanged.connect(lambda v: self.value_changed.emit(self.config.name, v))
-            return w
-        elif self.config.type == "enum":
-            w = QComboBox()
-            w.addItems(self.config.options)
-            w.setCurrentText(str(self.config.default))
-            w.currentTextChanged.connect(lambda v: self.value_changed.emit(self.config.name, v))
-            return w
-        elif self.config.type == "bool":
-            w = QCheckBox()
-            w.setChecked(bool(self.config.default))
-            w.stateChanged.connect(lambda v: self.value_changed.emit(self.config.name, bool(v)))
-            return w
-        else:
+        builder = self._INPUT_BUILDERS.get(self.config.type)
+        if builder is None:
             return QLabel(f"Unknown type: {self.config.type}")
+        return builder(self)
+    
+    def _create_float_input(self):
+        w = QDoubleSpinBox()
+        w.setRange(self.config.min_value or 0, self.config.max_value or 99999)
+        w.setValue(float(self.config.default))
+        w.valueChanged.connect(lambda v: self.value_changed.emit(self.config.name, v))
+        return w
+    
+    def _create_int_input(self):
+        w = QSpinBox()
+        w.setRange(int(self.config.min_value or 0), int(self.config.max_value or 99999))
+        w.setValue(int(self.config.default))
+        w.valueChanged.connect(lambda v: self.value_changed.emit(self.config.name, v))
+        return w
+    
+    def _create_enum_input(self):
+        w = QComboBox()
+        w.addItems(self.config.options)
+        w.setCurrentText(str(self.config.default))
+        w.currentTextChanged.connect(lambda v: self.value_changed.emit(self.config.name, v))
+        return w
+    
+    def _create_bool_input(self):
+        w = QCheckBox()
+        w.setChecked(bool(self.config.default))
+        w.stateChanged.connect(lambda v: self.value_changed.emit(self.config.name, bool(v)))
+        return w
+    
+    # Parameter type -> input builder, resolved with one lookup per widget
+    _INPUT_BUILDERS = {
+        "float": _create_float_input,
+        "int": _create_int_input,
+        "enum": _create_enum_input,
+        "bool": _create_bool_input,
+    }
 
     def _on_auto_toggled(self, state):
         # Disable input if auto is checked
@@ -92,7 +106,7 @@ class GroupedAutoWidget(QWidget):
         layout.setContentsMargins(0, 5, 0, 5)
         
         self.checkbox = QCheckBox(self.config.label)
-        self.checkbox.setStyleSheet("font-weight: bold; color: #4a90e2;") # Make it distinct
+        # Bold blue label comes from the app stylesheet (GroupedAutoWidget QCheckBox)
         self.checkbox.setChecked(self.config.default_active)
         self.checkbox.toggled.connect(self.toggled)
         
@@ -4,10 +4,24 @@ Displays preview shapes defined in the configuration.
 Supports parametric rendering using equations and variables.
 """
 
-from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QWidget, QVBoxLayout
-from PySide6.QtCore import Qt, QRectF
-from PySide6.QtGui import QPen, QBrush, QColor, QPainter
+import math
+
+from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QFrame
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPen, QBrush, QPainter
 from core.config_manager import PreviewShapeConfig
+from .simple_widgets import get_qcolor
+
+# Names available to preview expressions, built once at import
+_MATH_LOCALS = {k: getattr(math, k) for k in dir(math) if not k.startswith('_')}
+
+
+def _is_plain_number(text):
+    """Cheap check for literals like '12' or '-3.5' (no exception needed)"""
+    if text[:1] in '+-':
+        text = text[1:]
+    return text.replace('.', '', 1).isdecimal()
+
 
 class ShapePreviewWidget(QGraphicsView):
     def __init__(self, parent=None):
@@ -18,8 +32,10 @@ class ShapePreviewWidget(QGraphicsView):
         # Rendering settings
         self.setRenderHint(QPainter.Antialiasing)
         self.setBackgroundBrush(Qt.NoBrush)
-        # Transparent background or let parent decide
-        self.setStyleSheet("background: transparent; border: none;")
+        # Transparent background or let parent decide. Done with frame/fill
+        # attributes instead of a stylesheet so repaints skip the style engine
+        self.setFrameShape(QFrame.NoFrame)
+        self.viewport().setAutoFillBackground(False)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         
@@ -61,8 +77,12 @@ class ShapePreviewWidget(QGraphicsView):
             w = self._evaluate_value(shape.width, self.context_params)
             h = self._evaluate_value(shape.height, self.context_params)
             
-            fill_color = QColor(shape.color) if QColor.isValidColor(shape.color) else Qt.gray
-            border_color = QColor(shape.border_color) if QColor.isValidColor(shape.border_color) else Qt.black
+            fill_color = get_qcolor(shape.color)
+            if not fill_color.isValid():
+                fill_color = Qt.gray
+            border_color = get_qcolor(shape.border_color)
+            if not border_color.isValid():
+                border_color = Qt.black
             
             pen = QPen(border_color)
             pen.setWidth(int(shape.border_width))
@@ -95,6 +115,10 @@ class ShapePreviewWidget(QGraphicsView):
         val_str = value.strip()
         if not val_str:
             return 0.0
+        
+        # Plain numeric literals skip variable substitution and eval()
+        if _is_plain_number(val_str):
+            return float(val_str)
             
         # Replace variables "$var" with value
         # Sort params by length desc to avoid partial replacement (e.g. replacing $v in $var)
@@ -105,8 +129,7 @@ class ShapePreviewWidget(QGraphicsView):
                 
         # Safe evaluation
         try:
-            import math
-            allowed_locals = {k: getattr(math, k) for k in dir(math) if not k.startswith('_')}
-            return float(eval(val_str, {"__builtins__": None}, allowed_locals))
+            # Copy so an expression can't rebind names in the shared table
+            return float(eval(val_str, {"__builtins__": None}, _MATH_LOCALS.copy()))
         except Exception:
             return 0.0
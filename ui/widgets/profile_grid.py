@@ -5,12 +5,11 @@ Scrollable grid for profile management with card-based UI.
 Adapted from old version with themed styling.
 """
 
-from PySide6.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QGridLayout, QMessageBox
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtWidgets import QScrollArea, QWidget, QLabel, QVBoxLayout, QGridLayout, QMessageBox
+from PySide6.QtCore import Signal, Slot, Qt, QTimer
 
-from .themed_widgets import ThemedLabel
 from .profile_item import ProfileItem
-from core.theme_manager import get_theme_manager
+from .simple_widgets import ImageLoader
 
 
 class ProfileGrid(QScrollArea):
@@ -20,6 +19,10 @@ class ProfileGrid(QScrollArea):
     profile_selected = Signal(str, str)  # (profile_type, profile_name)
     profile_deleted = Signal(str, str)   # (profile_type, profile_name)
     
+    # Grid cell pitch: ProfileItem size (120x140) + layout spacing
+    _CELL_WIDTH = 130
+    _ROW_HEIGHT = 150
+    
     def __init__(self, profile_type, dialog_class, card_type="success", parent=None):
         super().__init__(parent)
         
@@ -30,15 +33,24 @@ class ProfileGrid(QScrollArea):
         self.profile_items = {}  # name -> ProfileItem widget
         self.profiles_data = {}  # name -> profile data
         self.selected_profile = None
+        self._positions = {}  # widget -> (row, col) it occupies in grid_layout
+        self._last_columns = -1  # column count of the last rearrange
+        self._realize_pending = False
         
-        # Get theme manager
-        self.theme_manager = get_theme_manager()
+        # One image decoder shared by all cards; results go to the cards
+        # showing that path
+        self._image_loader = ImageLoader(self)
+        self._image_loader.loaded.connect(self._on_image_loaded)
         
-        # UI Setup
-        self.setup_ui()
+        # Rearranges once a burst of resize events settles (restarted per event)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
         
-        # Connect to theme changes
-        self.theme_manager.theme_changed.connect(self.update_theme_colors)
+        # UI Setup - colors come from the global theme stylesheet
+        # (see ThemeManager.get_stylesheet)
+        self.setup_ui()
     
     def setup_ui(self):
         """Setup the grid UI"""
@@ -46,11 +58,9 @@ class ProfileGrid(QScrollArea):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         
-        # Apply theme colors
-        self.update_theme_colors()
-        
         # Container widget
         container = QWidget()
+        container.setObjectName("profileGridContainer")
         self.container = container
         self.setWidget(container)
         
@@ -58,7 +68,8 @@ class ProfileGrid(QScrollArea):
         main_layout = QVBoxLayout(container)
         
         # Title
-        self.title = ThemedLabel(f"{self.profile_type.capitalize()} Profiles")
+        self.title = QLabel(f"{self.profile_type.capitalize()} Profiles")
+        self.title.setObjectName("profileGridTitle")
         main_layout.addWidget(self.title)
         
         # Grid layout for items
@@ -67,73 +78,18 @@ class ProfileGrid(QScrollArea):
         main_layout.addLayout(self.grid_layout)
         main_layout.addStretch()
         
-        # Add initial "+" button
-        self.add_plus_button()
-    
-    def update_theme_colors(self):
-        """Update colors from theme"""
-        grid_colors = self.theme_manager.get_profile_grid_colors()
-        
-        bg = grid_colors['background']
-        border = grid_colors['border']
-        title_size = grid_colors['title_size']
-        scrollbar_bg = grid_colors['scrollbar']['background']
-        scrollbar_handle = grid_colors['scrollbar']['handle']
+        # Load card images as they scroll into view
+        self.verticalScrollBar().valueChanged.connect(self.schedule_realize)
+        self.verticalScrollBar().rangeChanged.connect(self.schedule_realize)
         
-        # Apply grid styles
-        self.setStyleSheet(f"""
-            ProfileGrid {{
-                background-color: {bg};
-                border: 1px solid {border};
-                border-radius: 4px;
-            }}
-            ProfileGrid QScrollBar:vertical {{
-                background-color: {scrollbar_bg};
-                width: 12px;
-                margin: 0px;
-            }}
-            ProfileGrid QScrollBar::handle:vertical {{
-                background-color: {scrollbar_handle};
-                min-height: 20px;
-                border-radius: 6px;
-            }}
-            ProfileGrid QScrollBar::add-line:vertical, ProfileGrid QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            ProfileGrid QScrollBar:horizontal {{
-                background-color: {scrollbar_bg};
-                height: 12px;
-                margin: 0px;
-            }}
-            ProfileGrid QScrollBar::handle:horizontal {{
-                background-color: {scrollbar_handle};
-                min-width: 20px;
-                border-radius: 6px;
-            }}
-            ProfileGrid QScrollBar::add-line:horizontal, ProfileGrid QScrollBar::sub-line:horizontal {{
-                width: 0px;
-            }}
-        """)
-        
-        # Update container background
-        if hasattr(self, 'container'):
-            self.container.setStyleSheet(f"QWidget {{ background-color: {bg}; }}")
-        
-        # Update title style
-        if hasattr(self, 'title'):
-            self.title.setStyleSheet(f"""
-                QLabel {{
-                    font-size: {title_size}px; 
-                    font-weight: bold; 
-                    padding: 10px; 
-                }}
-            """)
+        # "+" button, placed together with the profiles by update_profiles
+        self.add_plus_button()
+        self.update_profiles({})
     
     def add_plus_button(self):
-        """Add the '+' button for creating new profiles"""
-        add_item = ProfileItem("Add", is_add_button=True, card_type=self.card_type)
-        add_item.clicked.connect(self.create_new_profile)
-        self.grid_layout.addWidget(add_item, 0, 0)
+        """Create the '+' button for creating new profiles (reused, never deleted)"""
+        self._add_item = ProfileItem("Add", is_add_button=True, card_type=self.card_type)
+        self._add_item.clicked.connect(self.create_new_profile)
     
     def update_profiles(self, profiles_dict, selected_name=None):
         """Update grid with profiles dictionary and selected profile"""
@@ -141,39 +97,71 @@ class ProfileGrid(QScrollArea):
         self.profiles_data = profiles_dict.copy()
         self.selected_profile = selected_name
         
-        # Clear existing profile items (keep + button)
-        for item in list(self.profile_items.values()):
-            item.deleteLater()
-        self.profile_items.clear()
+        # Suspend painting so the rebuild costs one relayout/repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Remove items for profiles that are gone (keep + button)
+            for name in self.profile_items.keys() - profiles_dict.keys():
+                item = self.profile_items.pop(name)
+                self.grid_layout.removeWidget(item)
+                del self._positions[item]
+                item.deleteLater()
         
-        # Add profiles
-        row, col = 0, 1  # Start after + button
-        for profile_name, profile_data in profiles_dict.items():
-            self.add_profile_item(profile_name, profile_data, row, col)
-            col += 1
-            if col > self.get_columns_count():
-                col = 0
-                row += 1
+            # "+" button pinned first, then profiles - existing items are
+            # updated in place and re-placed
+            columns = self.get_columns_count()
+            self._place(self._add_item, 0, 0)
+            for index, (profile_name, profile_data) in enumerate(profiles_dict.items(), 1):
+                row, col = divmod(index, columns)
+                item = self.profile_items.get(profile_name)
+                if item is None:
+                    self.add_profile_item(profile_name, profile_data, row, col)
+                else:
+                    item.update_data(profile_data)
+                    self._place(item, row, col)
         
-        # Update selection states
-        self.update_selection_states()
+            # Update selection states
+            self.update_selection_states()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.container.updateGeometry()
+        
+        # Placement above already matches the current width
+        self._last_columns = columns
+        self.schedule_realize()
     
     def add_profile_item(self, name, profile_data, row, col):
         """Add a single profile item to the grid"""
-        item = ProfileItem(name, profile_data, card_type=self.card_type)
-        item.clicked.connect(lambda n: self.on_profile_clicked(n))
+        item = ProfileItem(name, profile_data, card_type=self.card_type, defer_image=True,
+                           image_loader=self._image_loader)
+        item.clicked.connect(self.on_profile_clicked)
         item.edit_requested.connect(self.edit_profile)
         item.duplicate_requested.connect(self.duplicate_profile)
         item.delete_requested.connect(self.delete_profile)
         
         self.profile_items[name] = item
-        self.grid_layout.addWidget(item, row, col)
+        self._place(item, row, col)
+    
+    def _on_image_loaded(self, path, image):
+        """Hand a decoded image to the cards waiting for it"""
+        for item in self.profile_items.values():
+            item.on_image_loaded(path, image)
+    
+    def _place(self, widget, row, col):
+        """Put widget at (row, col), leaving it alone if it is already there"""
+        if self._positions.get(widget) == (row, col):
+            return
+        if widget in self._positions:
+            self.grid_layout.removeWidget(widget)
+        self.grid_layout.addWidget(widget, row, col)
+        self._positions[widget] = (row, col)
     
     def update_selection_states(self):
         """Update visual selection states of all items"""
         for name, item in self.profile_items.items():
             item.set_selected(name == self.selected_profile)
     
+    @Slot(str)
     def on_profile_clicked(self, name):
         """Handle profile selection"""
         if name == "Add":
@@ -183,6 +171,7 @@ class ProfileGrid(QScrollArea):
         self.update_selection_states()
         self.profile_selected.emit(self.profile_type, name)
     
+    @Slot()
     def create_new_profile(self):
         """Create new profile using dialog"""
         if self.dialog_class is None:
@@ -191,6 +180,7 @@ class ProfileGrid(QScrollArea):
         dialog = self.dialog_class(self.profile_type, parent=self)
         dialog.exec()
     
+    @Slot(str)
     def edit_profile(self, name):
         """Edit existing profile"""
         if self.dialog_class is None:
@@ -201,6 +191,7 @@ class ProfileGrid(QScrollArea):
             dialog = self.dialog_class(self.profile_type, profile_data, parent=self)
             dialog.exec()
     
+    @Slot(str)
     def duplicate_profile(self, name):
         """Duplicate existing profile with unique name"""
         if name not in self.profiles_data:
@@ -224,47 +215,90 @@ class ProfileGrid(QScrollArea):
         dialog = self.dialog_class(self.profile_type, profile_data, parent=self)
         dialog.exec()
     
+    @Slot(str)
     def delete_profile(self, name):
-        """Delete profile after confirmation"""
-        reply = QMessageBox.question(self, "Delete Profile",
-                                   f"Are you sure you want to delete '{name}'?",
-                                   QMessageBox.Yes | QMessageBox.No)
-        
-        if reply == QMessageBox.Yes:
+        """Ask for confirmation, then delete profile (see _finish_delete).
+        The box is window-modal but not a nested event loop, so the app keeps
+        painting while it is open."""
+        box = QMessageBox(QMessageBox.Question, "Delete Profile",
+                          f"Are you sure you want to delete '{name}'?",
+                          QMessageBox.Yes | QMessageBox.No, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(lambda result: self._finish_delete(name, result))
+        box.open()
+    
+    def _finish_delete(self, name, result):
+        """Emit the deletion if the confirmation box was accepted"""
+        if result == QMessageBox.Yes:
             self.profile_deleted.emit(self.profile_type, name)
     
     def get_columns_count(self):
         """Calculate number of columns based on current width"""
-        item_width = 130  # ProfileItem width + spacing
-        available_width = self.viewport().width()
-        return max(1, available_width // item_width)
+        # Read live: the viewport narrows when the vertical scrollbar
+        # appears, which does not send the grid a resizeEvent
+        return max(1, self.viewport().width() // self._CELL_WIDTH)
     
     def resizeEvent(self, event):
-        """Handle resize to rearrange grid"""
+        """Handle resize to rearrange grid once resizing settles"""
         super().resizeEvent(event)
+        self._resize_timer.start()
+    
+    def _on_resize_settled(self):
+        """Rearrange for the final size of a resize burst"""
         self.rearrange_grid()
+        self.schedule_realize()
     
     def rearrange_grid(self):
-        """Rearrange grid items based on current width"""
+        """Rearrange grid items based on current width.
+        Does nothing while the column count is unchanged."""
         columns = self.get_columns_count()
+        if columns == self._last_columns:
+            return
+        self._last_columns = columns
         
-        # Get all widgets
-        widgets = []
-        for i in range(self.grid_layout.count()):
-            item = self.grid_layout.itemAt(i)
-            if item and item.widget():
-                widgets.append(item.widget())
+        self.setUpdatesEnabled(False)
+        try:
+            # "+" button first, then profiles in data order
+            widgets = [self._add_item]
+            widgets.extend(self.profile_items[name] for name in self.profiles_data)
         
-        # Clear grid
-        while self.grid_layout.count():
-            self.grid_layout.takeAt(0)
+            # A new column count moves nearly every item, so re-pack in one pass
+            # instead of per-widget removeWidget (a linear search each). Take
+            # items from the end - takeAt(0) would shift the rest every time.
+            while self.grid_layout.count():
+                self.grid_layout.takeAt(self.grid_layout.count() - 1)
         
-        # Re-add widgets
-        row, col = 0, 0
-        for widget in widgets:
-            self.grid_layout.addWidget(widget, row, col)
-            col += 1
-            if col >= columns:
-                col = 0
-                row += 1
-
+            for index, widget in enumerate(widgets):
+                row, col = divmod(index, columns)
+                self.grid_layout.addWidget(widget, row, col)
+                self._positions[widget] = (row, col)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def showEvent(self, event):
+        """Load images for the cards visible when the grid is first shown"""
+        super().showEvent(event)
+        self.schedule_realize()
+    
+    def schedule_realize(self):
+        """Schedule loading images of cards in or near the viewport"""
+        if not self._realize_pending:
+            self._realize_pending = True
+            QTimer.singleShot(0, self._realize_visible)
+    
+    def _realize_visible(self):
+        """Load deferred images for cards within one row of the viewport"""
+        self._realize_pending = False
+        if not self.isVisible():
+            return
+        
+        # Make sure card geometries reflect the latest placement
+        self.container.layout().activate()
+        
+        top = self.verticalScrollBar().value() - self._ROW_HEIGHT  # One row of prefetch
+        bottom = top + self.viewport().height() + 2 * self._ROW_HEIGHT
+        for item in self.profile_items.values():
+            if not item.image_realized:
+                geometry = item.geometry()
+                if geometry.bottom() >= top and geometry.top() <= bottom:
+                    item.realize_image()
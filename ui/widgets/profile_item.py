@@ -5,23 +5,46 @@ Individual profile card widget for displaying profiles in a grid.
 Adapted from old version with themed styling.
 """
 
-from PySide6.QtWidgets import QFrame, QVBoxLayout
-from PySide6.QtCore import Signal, Qt
-from PySide6.QtGui import QPixmap
+import os
 
-from .themed_widgets import ThemedLabel, ThemedMenu
-from .simple_widgets import PlaceholderPixmap, ClickableImageLabel
+from PySide6.QtWidgets import QFrame
+from PySide6.QtCore import Signal, Slot, Qt, QTimer, QSize, QRect, QRectF, QPointF
+from PySide6.QtGui import QPixmap, QPixmapCache, QAction, QPainter, QPalette
+
+from .themed_widgets import ThemedMenu
+from .simple_widgets import PlaceholderPixmap, ImageLoader, get_qcolor
 from core.theme_manager import get_theme_manager
 
 
+# Context menu actions shared by every ProfileItem (created on first use,
+# once a QApplication exists)
+_CTX_ACTIONS = {}
+
+
+def _context_actions():
+    """Get the shared Edit/Duplicate/Delete context menu actions"""
+    if not _CTX_ACTIONS:
+        _CTX_ACTIONS['edit'] = QAction("Edit")
+        _CTX_ACTIONS['duplicate'] = QAction("Duplicate")
+        _CTX_ACTIONS['delete'] = QAction("Delete")
+    return _CTX_ACTIONS
+
+
 class ProfileItem(QFrame):
-    """Individual profile card with selection states and context menus"""
+    """Individual profile card with selection states and context menus.
+    The image box and name are painted directly rather than built from child
+    labels, so a grid of cards is one widget per card."""
+    # Note: no __slots__ here - Shiboken wrapper instances always carry a
+    # __dict__, so slots on a QFrame subclass would not shrink instances
     clicked = Signal(str)
     edit_requested = Signal(str)
     duplicate_requested = Signal(str)
     delete_requested = Signal(str)
     
-    def __init__(self, name, profile_data=None, is_add_button=False, card_type="success", parent=None):
+    _IMAGE_SIZE = 100  # Side of the image box, in logical pixels
+    
+    def __init__(self, name, profile_data=None, is_add_button=False, card_type="success",
+                 defer_image=False, image_loader=None, parent=None):
         super().__init__(parent)
         self.name = name
         self.profile_data = profile_data or {}
@@ -29,35 +52,39 @@ class ProfileItem(QFrame):
         self.card_type = card_type  # "neutral", "success", or "danger"
         self.selected = False
         self._is_hovered = False
+        self._style_pending = False
+        self._applied_state = None  # "state" property last polished with
+        self._src_path = None  # path the source pixmap was decoded from
+        self._src_pixmap = None  # decoded once, prescaled to the image box
+        self._pixmap = None  # what the image box shows
+        # Shared ImageLoader whose results the owner passes to on_image_loaded;
+        # without one, the card creates its own on first image load
+        self._image_loader = image_loader
+        self._menu = None  # context menu, created on first right-click
+        self.image_realized = not defer_image  # False: show placeholder until realize_image()
         
         # Get theme manager
         self.theme_manager = get_theme_manager()
         
         self.setFixedSize(120, 140)
         self.setCursor(Qt.PointingHandCursor)
+        # Selects the ProfileItem[card_type=...][state=...] rules of the app
+        # stylesheet, which also give the color and font the name is drawn in
+        self.setProperty("card_type", card_type)
         
-        # Layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        # Image
-        self.image_label = ClickableImageLabel((100, 100))
-        self.image_label.setScaledContents(True)
         self.update_image()
-        layout.addWidget(self.image_label, alignment=Qt.AlignCenter)
-        
-        # Name label
-        self.name_label = ThemedLabel(name)
-        self.name_label.setAlignment(Qt.AlignCenter)
-        self.name_label.setWordWrap(True)
-        layout.addWidget(self.name_label)
         
         # Set initial style
-        self.update_style()
+        self._do_update_style()
         
-        # Connect to theme changes - both for style and image
-        self.theme_manager.theme_changed.connect(self.update_style)
-        self.theme_manager.theme_changed.connect(self.update_image)
+        # Connect to theme changes - one connection refreshes style and image
+        self.theme_manager.theme_changed.connect(self._on_theme_changed)
+    
+    @Slot(str)
+    def _on_theme_changed(self, theme_name):
+        """Re-theme the placeholder image and the card style"""
+        self.update_image()
+        self.update_style()
     
     def update_image(self):
         """Update the displayed image"""
@@ -69,18 +96,78 @@ class ProfileItem(QFrame):
         if self.is_add_button:
             # Add button placeholder with theme colors
             pixmap = PlaceholderPixmap.create_add_button((100, 100), image_bg, text_color)
-        elif self.profile_data.get("image"):
-            # Load profile image
-            loaded_pixmap = QPixmap(self.profile_data["image"])
-            if not loaded_pixmap.isNull():
-                pixmap = loaded_pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            else:
+        elif self.profile_data.get("image") and self.image_realized:
+            # Load profile image, prescaled to the label
+            pixmap = self._profile_image()
+            if pixmap is None:
                 pixmap = PlaceholderPixmap.create_file_icon((100, 100), icon="📄", background_color=image_bg, text_color=text_color)
         else:
             # Default profile icon with theme colors
             pixmap = PlaceholderPixmap.create_file_icon((100, 100), icon="📄", background_color=image_bg, text_color=text_color)
         
-        self.image_label.setPixmap(pixmap)
+        self._pixmap = pixmap
+        self.update()
+    
+    def realize_image(self):
+        """Load the profile image if it was deferred at construction"""
+        if self.image_realized:
+            return
+        self.image_realized = True
+        if self.profile_data.get("image"):
+            self.update_image()
+    
+    def _profile_image(self):
+        """Return the decoded profile image, or None if it can't be loaded
+        or is still loading"""
+        path = self.profile_data["image"]
+        if path != self._src_path:
+            # Decode once per path, off the GUI thread; theme changes reuse
+            # the same pixmap. The placeholder shows until it arrives.
+            self._src_path = path
+            self._src_pixmap = QPixmapCache.find(self._image_cache_key(path, self._image_size()))
+            if self._src_pixmap is not None:
+                # Already decoded for another card or an earlier grid refresh
+                return self._src_pixmap
+            if self._image_loader is None:
+                self._image_loader = ImageLoader(self)
+                self._image_loader.loaded.connect(self.on_image_loaded)
+            self._image_loader.load(path, self._image_size())
+        
+        if self._src_pixmap is None or self._src_pixmap.isNull():
+            return None
+        return self._src_pixmap
+    
+    def on_image_loaded(self, path, image):
+        """Show a decoded profile image, unless the path changed meanwhile"""
+        if path != self._src_path:
+            return
+        self._src_pixmap = QPixmap.fromImage(image)
+        if not self._src_pixmap.isNull():
+            self._src_pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+            QPixmapCache.insert(self._image_cache_key(path, self._image_size()), self._src_pixmap)
+            self.update_image()
+    
+    def _image_size(self):
+        """Device-pixel size profile images are scaled to fit"""
+        return QSize(100, 100) * self.devicePixelRatioF()
+    
+    @staticmethod
+    def _image_cache_key(path, size):
+        """QPixmapCache key for a scaled image file - includes mtime so
+        edited files are decoded again"""
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = 0
+        return f"img:{path}:{mtime}:{size.width()}x{size.height()}"
+    
+    def update_data(self, profile_data):
+        """Swap in new profile data, reusing this card"""
+        profile_data = profile_data or {}
+        if profile_data == self.profile_data:
+            return
+        self.profile_data = profile_data
+        self.update_image()
     
     def set_selected(self, selected):
         """Update selection state"""
@@ -88,68 +175,96 @@ class ProfileItem(QFrame):
         self.update_style()
     
     def update_style(self):
-        """Apply styling based on current state using theme colors"""
-        # Get colors from theme
-        colors = self.theme_manager.get_profile_card_colors(self.card_type)
-        card_styles = self.theme_manager.get_style('cards')
-        
-        # Get border radius and width from theme
-        border_radius = card_styles.get('border_radius', 4) if card_styles else 4
-        border_width = card_styles.get('border_width', 2) if card_styles else 2
-        
+        """Schedule a style refresh, coalescing bursts of state changes
+        (enter/leave/selection) within one event-loop turn into one re-parse"""
+        if self._style_pending:
+            return
+        self._style_pending = True
+        QTimer.singleShot(0, self._flush_style)
+    
+    def _flush_style(self):
+        """Run the pending style refresh, if still pending"""
+        if not self._style_pending:
+            return
+        self._style_pending = False
+        self._do_update_style()
+    
+    def _state(self):
+        """Current visual state: 'selected', 'hovered' or 'normal'"""
         if self.selected:
-            # Selected state
-            bg_color = colors['selected']['background']
-            border_color = colors['selected']['border']
-            border_width = 3  # Thicker border for selected
-        elif self._is_hovered:
-            # Hover state
-            bg_color = colors['hovered']['background']
-            border_color = colors['hovered']['border']
-        else:
-            # Normal state
-            bg_color = colors['normal']['background']
-            border_color = colors['normal']['border']
-        
-        # Get text color for label from theme
-        text_color = self.theme_manager.get_color('text.primary')
-        
-        # Get image background color from theme
-        image_bg = colors.get('card_image_background', '#282a36')
+            return 'selected'
+        if self._is_hovered:
+            return 'hovered'
+        return 'normal'
+    
+    def _do_update_style(self):
+        """Apply styling based on current state using theme colors"""
+        state = self._state()
+        # Only re-polish on a real change - enter/leave/selection often land
+        # on the same state. The image box border follows the card border,
+        # so it needs no separate refresh.
+        if state == self._applied_state:
+            return
+        self._applied_state = state
+        self.setProperty("state", state)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+        self.update()
+    
+    def paintEvent(self, event):
+        """Paint the card (stylesheet), then the image box and the name"""
+        super().paintEvent(event)
         
-        self.setStyleSheet(f"""
-            ProfileItem {{
-                background-color: {bg_color};
-                border: {border_width}px solid {border_color};
-                border-radius: {border_radius}px;
-            }}
-        """)
+        colors = self.theme_manager.get_profile_card_colors(self.card_type)
+        area = self.contentsRect().adjusted(5, 5, -5, -5)
+        size = self._IMAGE_SIZE
+        box = QRect(area.left() + (area.width() - size) // 2, area.top(), size, size)
         
-        # Update label color
-        self.name_label.setStyleSheet(f"color: {text_color}; background: transparent;")
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
         
-        # Update image label background
-        self.image_label.setStyleSheet(f"""
-            ClickableImageLabel {{
-                background-color: {image_bg};
-                border: 1px solid {border_color};
-                border-radius: 4px;
-            }}
-        """)
+        # Image box: rounded 1px frame, pixmap centered and clipped inside it
+        frame = QRectF(box).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(get_qcolor(colors.get('card_image_background', '#282a36')))
+        painter.drawRoundedRect(frame, 4, 4)
+        if self._pixmap is not None and not self._pixmap.isNull():
+            pixmap_size = self._pixmap.deviceIndependentSize()
+            painter.save()
+            painter.setClipRect(box.adjusted(1, 1, -1, -1))
+            painter.drawPixmap(QPointF(box.x() + (size - pixmap_size.width()) / 2,
+                                       box.y() + (size - pixmap_size.height()) / 2), self._pixmap)
+            painter.restore()
+        painter.setPen(get_qcolor(colors[self._state()]['border']))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(frame, 4, 4)
         
-        self.update()
+        # Name: wrapped and centered below the image box, in the card's
+        # stylesheet color and font
+        name_rect = QRect(area.left(), box.bottom() + 1, area.width(), area.bottom() - box.bottom())
+        flags = Qt.AlignCenter | Qt.TextWordWrap
+        needed = self.fontMetrics().boundingRect(name_rect, flags, self.name).height()
+        if needed > name_rect.height():
+            # Long names grow up over the image box rather than being cut off
+            name_rect.setTop(max(area.top(), name_rect.bottom() - needed + 1))
+        painter.setPen(self.palette().color(QPalette.WindowText))
+        painter.drawText(name_rect, flags, self.name)
+        painter.end()
     
     def enterEvent(self, event):
         """Handle mouse enter"""
-        if not self.selected:
+        # Repeated enters (e.g. when re-entering from a child) change nothing
+        if not self.selected and not self._is_hovered:
             self._is_hovered = True
             self.update_style()
         super().enterEvent(event)
     
     def leaveEvent(self, event):
         """Handle mouse leave"""
-        self._is_hovered = False
-        self.update_style()
+        if self._is_hovered:
+            self._is_hovered = False
+            self.update_style()
         super().leaveEvent(event)
     
     def mousePressEvent(self, event):
@@ -162,19 +277,22 @@ class ProfileItem(QFrame):
     
     def show_context_menu(self, pos):
         """Show right-click context menu"""
-        menu = ThemedMenu(self)
+        actions = _context_actions()
         
-        edit_action = menu.addAction("Edit")
-        duplicate_action = menu.addAction("Duplicate")
-        menu.addSeparator()
-        delete_action = menu.addAction("Delete")
+        if self._menu is None:
+            # Built on the first right-click and reused; parented to the card
+            # so it picks up the app stylesheet's ThemedMenu rule
+            self._menu = ThemedMenu(self)
+            self._menu.addAction(actions['edit'])
+            self._menu.addAction(actions['duplicate'])
+            self._menu.addSeparator()
+            self._menu.addAction(actions['delete'])
         
-        action = menu.exec(pos)
+        action = self._menu.exec(pos)
         
-        if action == edit_action:
+        if action is actions['edit']:
             self.edit_requested.emit(self.name)
-        elif action == duplicate_action:
+        elif action is actions['duplicate']:
             self.duplicate_requested.emit(self.name)
-        elif action == delete_action:
+        elif action is actions['delete']:
             self.delete_requested.emit(self.name)
-
@@ -4,13 +4,31 @@ Simple Widgets Module
 Updated with ScaledPreviewLabel for proper aspect ratio scaling.
 """
 
-from PySide6.QtWidgets import QLabel, QLineEdit, QSizePolicy
-from PySide6.QtCore import Signal, Qt, QSize
-from PySide6.QtGui import QPixmap, QPainter, QColor, QFont
+from PySide6.QtWidgets import QLabel, QSizePolicy
+from PySide6.QtCore import Signal, Slot, Qt, QObject, QRunnable, QThreadPool, QTimer, QCoreApplication
+from PySide6.QtGui import QPixmap, QPixmapCache, QPainter, QColor, QImage
+from functools import lru_cache
 from .themed_widgets import ThemedLineEdit
 from core.theme_manager import get_theme_manager
 
 
+@lru_cache(maxsize=256)
+def get_qcolor(color_str):
+    """Get a QColor for a theme color string, parsing each string only once.
+    The returned instance is shared - copy it before mutating."""
+    return QColor(color_str)
+
+
+def _fit_pixmap(pixmap, size, transform):
+    """Scale pixmap to fit size, keeping its aspect ratio. Within a pixel of
+    the source size the source is returned as is - resampling would only
+    cost time and blur it."""
+    fitted = pixmap.size().scaled(size, Qt.KeepAspectRatio)
+    if abs(fitted.width() - pixmap.width()) <= 1 and abs(fitted.height() - pixmap.height()) <= 1:
+        return pixmap
+    return pixmap.scaled(size, Qt.KeepAspectRatio, transform)
+
+
 class ClickableLabel(QLabel):
     """Label that acts like a button/link with hover effects"""
     clicked = Signal()
@@ -23,12 +41,21 @@ class ClickableLabel(QLabel):
         # Connect to theme changes
         self.theme_manager.theme_changed.connect(self.update_theme_colors)
     
+    @Slot()
     def update_theme_colors(self):
         """Update colors from theme"""
-        link_color = self.theme_manager.get_color('text.links')
-        accent = self.theme_manager.get_color('accents.primary')
+        # Built once per theme, shared by all instances
+        qss = self.theme_manager.get_compiled_qss('ClickableLabel', self._build_ss)
+        if qss != self.styleSheet():
+            self.setStyleSheet(qss)
+    
+    @staticmethod
+    def _build_ss(tm):
+        """Resolve theme colors and assemble the link stylesheet"""
+        link_color = tm.get_color('text.links')
+        accent = tm.get_color('accents.primary')
         
-        self.setStyleSheet(f"""
+        return f"""
             QLabel {{
                 color: {link_color};
                 text-decoration: underline;
@@ -37,7 +64,7 @@ class ClickableLabel(QLabel):
             QLabel:hover {{
                 color: {accent};
             }}
-        """)
+        """
     
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -54,25 +81,45 @@ class ScaledImageLabel(QLabel):
         self.setAlignment(Qt.AlignCenter)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self._pixmap = None
+        self._scaled_key = None  # (size, transform) of the displayed scale
+        
+        # Smooth rescale once a resize burst settles (see resizeEvent)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self.updatePixmap)
     
     def setPixmap(self, pixmap):
         """Set pixmap and store original for scaling"""
         self._pixmap = pixmap
+        self._scaled_key = None
         self.updatePixmap()
     
-    def updatePixmap(self):
+    def updatePixmap(self, transform=Qt.SmoothTransformation):
         """Update displayed pixmap based on current size"""
         if self._pixmap and not self._pixmap.isNull():
-            scaled = self._pixmap.scaled(
-                self.size(), 
-                Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
-            )
+            # Hidden (e.g. on another tab): leave it to showEvent
+            if not self.isVisible():
+                self._scaled_key = None
+                return
+            # Layout passes often resend the same size; skip identical rescales
+            key = (self.size(), transform)
+            if key == self._scaled_key:
+                return
+            self._scaled_key = key
+            scaled = _fit_pixmap(self._pixmap, self.size(), transform)
             super().setPixmap(scaled)
     
     def resizeEvent(self, event):
         """Handle resize to update pixmap scaling"""
         super().resizeEvent(event)
+        # Window drags resize every frame: use a cheap scale until they stop
+        self.updatePixmap(Qt.FastTransformation)
+        self._resize_timer.start()
+    
+    def showEvent(self, event):
+        """Scale anything deferred while hidden"""
+        super().showEvent(event)
         self.updatePixmap()
 
 
@@ -89,18 +136,37 @@ class ScaledPreviewLabel(QLabel):
         self.setMinimumSize(200, 200)  # Minimum reasonable size
         self._pixmap = None
         self._placeholder_text = ""
+        # What updateDisplay last showed: (size, transform) of the scaled
+        # pixmap, or the placeholder text
+        self._display_key = None
+        
+        # Smooth rescale once a resize burst settles (see resizeEvent)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self.updateDisplay)
         
         # Apply theme colors
         self.update_theme_colors()
         # Connect to theme changes
         self.theme_manager.theme_changed.connect(self.update_theme_colors)
     
+    @Slot()
     def update_theme_colors(self):
         """Update colors from theme"""
-        preview_colors = self.theme_manager.get_image_preview_colors()
-        text_color = self.theme_manager.get_color('text.secondary')
+        # Built once per theme, shared by all instances; re-applied only if
+        # it changed (editor previews re-emit for edits to other components)
+        qss = self.theme_manager.get_compiled_qss('ScaledPreviewLabel', self._build_ss)
+        if qss != self.styleSheet():
+            self.setStyleSheet(qss)
+    
+    @staticmethod
+    def _build_ss(tm):
+        """Resolve theme colors and assemble the preview stylesheet"""
+        preview_colors = tm.get_image_preview_colors()
+        text_color = tm.get_color('text.secondary')
         
-        self.setStyleSheet(f"""
+        return f"""
             QLabel {{
                 background-color: {preview_colors['background']};
                 border: 2px solid {preview_colors['border_inactive']};
@@ -108,16 +174,21 @@ class ScaledPreviewLabel(QLabel):
                 color: {text_color};
                 padding: 10px;
             }}
-        """)
+        """
     
     def setPixmap(self, pixmap):
         """Set pixmap and store original for scaling"""
         if pixmap and not pixmap.isNull():
+            # Previews re-set the same image on unrelated edits; cacheKey is
+            # shared by copies of the same pixmap data
+            if self._pixmap is not None and pixmap.cacheKey() == self._pixmap.cacheKey():
+                return
             self._pixmap = pixmap
             self._placeholder_text = ""  # Clear placeholder when setting valid image
         else:
             # Invalid pixmap, clear it
             self._pixmap = None
+        self._display_key = None
         self.updateDisplay()
     
     def setText(self, text):
@@ -126,35 +197,41 @@ class ScaledPreviewLabel(QLabel):
         self._pixmap = None
         self.updateDisplay()
     
-    def updateDisplay(self):
+    def updateDisplay(self, transform=Qt.SmoothTransformation):
         """Update displayed content based on current size"""
         if self._pixmap and not self._pixmap.isNull():
+            # Hidden (e.g. on another tab): leave it to showEvent
+            if not self.isVisible():
+                self._display_key = None
+                return
+            # Layout passes often resend the same size; skip identical rescales
+            key = (self.size(), transform)
+            if key == self._display_key:
+                return
+            self._display_key = key
             # Scale pixmap to fit available space while maintaining aspect ratio
-            scaled = self._pixmap.scaled(
-                self.size(), 
-                Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
-            )
-            super().setPixmap(scaled)
-            super().setText("")  # Clear any text
+            scaled = _fit_pixmap(self._pixmap, self.size(), transform)
+            super().setPixmap(scaled)  # Also clears any placeholder text
         else:
-            # Show placeholder text
+            # Show placeholder text - it doesn't depend on size, so resizes
+            # skip clearing the pixmap and resetting the same text
+            if self._placeholder_text == self._display_key:
+                return
+            self._display_key = self._placeholder_text
             super().setPixmap(QPixmap())  # Clear any pixmap
             super().setText(self._placeholder_text)
     
     def resizeEvent(self, event):
         """Handle resize to update display"""
         super().resizeEvent(event)
-        self.updateDisplay()
+        # Window drags resize every frame: use a cheap scale until they stop
+        self.updateDisplay(Qt.FastTransformation)
+        self._resize_timer.start()
     
-    def paintEvent(self, event):
-        """Custom paint to handle text centering properly"""
-        if self._pixmap and not self._pixmap.isNull():
-            # Let QLabel handle pixmap painting with proper scaling
-            super().paintEvent(event)
-        else:
-            # Let QLabel handle background and placeholder text drawing once
-            super().paintEvent(event)
+    def showEvent(self, event):
+        """Scale anything deferred while hidden"""
+        super().showEvent(event)
+        self.updateDisplay()
     
     def clear(self):
         """Clear both pixmap and text"""
@@ -188,11 +265,21 @@ class ClickableImageLabel(QLabel):
         # Connect to theme changes
         self.theme_manager.theme_changed.connect(self.update_theme_colors)
     
+    @Slot()
     def update_theme_colors(self):
         """Update colors from theme"""
-        preview_colors = self.theme_manager.get_image_preview_colors()
+        # Built once per theme, shared by all instances; re-applied only if
+        # it changed (editor previews re-emit for edits to other components)
+        qss = self.theme_manager.get_compiled_qss('ClickableImageLabel', self._build_ss)
+        if qss != self.styleSheet():
+            self.setStyleSheet(qss)
+    
+    @staticmethod
+    def _build_ss(tm):
+        """Resolve theme colors and assemble the image selector stylesheet"""
+        preview_colors = tm.get_image_preview_colors()
         
-        self.setStyleSheet(f"""
+        return f"""
             ClickableImageLabel {{
                 background-color: {preview_colors['background']};
                 border: 2px solid {preview_colors['border_inactive']};
@@ -202,28 +289,16 @@ class ClickableImageLabel(QLabel):
                 background-color: {preview_colors['background']};
                 border: 2px solid {preview_colors['border_active']};
             }}
-        """)
+        """
         
     def mousePressEvent(self, event):
         """Forward both left and right clicks to parent"""
         if event.button() == Qt.LeftButton:
             self.clicked.emit()
         
-        # Forward the event to parent so it can handle right-clicks too
-        # Convert the event position to parent coordinates
-        parent_pos = self.mapToParent(event.pos())
-        new_event = type(event)(
-            event.type(),
-            parent_pos,
-            event.globalPos(),
-            event.button(),
-            event.buttons(),
-            event.modifiers()
-        )
-        
-        # Send the event to the parent
-        if self.parent():
-            self.parent().mousePressEvent(new_event)
+        # Leave the press unaccepted so Qt propagates it to the parent (which
+        # handles right-clicks too), already mapped to parent coordinates
+        event.ignore()
 
 
 class ErrorLineEdit(ThemedLineEdit):
@@ -235,34 +310,14 @@ class ErrorLineEdit(ThemedLineEdit):
     
     def set_error(self, has_error):
         """Set error state and update styling"""
+        has_error = bool(has_error)
+        # Live validation re-sends the same state on most keystrokes
+        if has_error == self._has_error:
+            return
         self._has_error = has_error
-        if has_error:
-            self.setStyleSheet("""
-                QLineEdit {
-                    background-color: #1d1f28;
-                    color: #ffffff;
-                    border: 2px solid #ff4444;
-                    border-radius: 4px;
-                    padding: 4px;
-                }
-                QLineEdit:focus {
-                    border: 2px solid #ff4444;
-                }
-            """)
-        else:
-            # Reset to normal themed style
-            self.setStyleSheet("""
-                QLineEdit {
-                    background-color: #1d1f28;
-                    color: #ffffff;
-                    border: 1px solid #6f779a;
-                    border-radius: 4px;
-                    padding: 4px;
-                }
-                QLineEdit:focus {
-                    border: 1px solid #BB86FC;
-                }
-            """)
+        # Selects the app stylesheet's ErrorLineEdit[error="true"] rule
+        self.setProperty("error", has_error)
+        self.style().polish(self)
     
     def has_error(self):
         """Check if widget has error state"""
@@ -274,16 +329,24 @@ class PlaceholderPixmap:
     
     @staticmethod
     def create(size, text="", background_color="#44475c", text_color="#bdbdc0"):
-        """Create a placeholder pixmap with text"""
+        """Create a placeholder pixmap with text.
+        Placeholders are deterministic, so identical ones (e.g. every card in
+        a grid) share one cached pixmap instead of being repainted per widget."""
+        key = f"ph:{text}:{size[0]}x{size[1]}:{background_color}:{text_color}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+        
         pixmap = QPixmap(*size)
-        pixmap.fill(QColor(background_color))
+        pixmap.fill(get_qcolor(background_color))
         
         if text:
             painter = QPainter(pixmap)
-            painter.setPen(QColor(text_color))
+            painter.setPen(get_qcolor(text_color))
             painter.drawText(pixmap.rect(), Qt.AlignCenter, text)
             painter.end()
         
+        QPixmapCache.insert(key, pixmap)
         return pixmap
     
     @staticmethod
@@ -304,4 +367,72 @@ class PlaceholderPixmap:
     @staticmethod
     def create_file_icon(size=(60, 60), icon="📄", background_color="#44475c", text_color="#bdbdc0"):
         """Create file icon placeholder"""
-        return PlaceholderPixmap.create(size, icon, background_color, text_color)
\ No newline at end of file
+        return PlaceholderPixmap.create(size, icon, background_color, text_color)
+
+
+class _ImageLoadSignals(QObject):
+    """Signals of one _ImageLoadTask"""
+    loaded = Signal(object, QImage)  # (ImageLoader key, image)
+
+
+class _ImageLoadTask(QRunnable):
+    """Decodes one image for ImageLoader on a worker thread.
+    The task owns its signals object, so a loader deleted mid-load only
+    loses the queued result instead of emitting from a deleted object."""
+    
+    def __init__(self, key, path, size):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.size = size
+        self.signals = _ImageLoadSignals()
+    
+    def run(self):
+        image = QImage(self.path)
+        if self.size is not None and not image.isNull():
+            image = image.scaled(self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        try:
+            self.signals.loaded.emit(self.key, image)
+        except RuntimeError:
+            pass  # Signals deleted during app teardown - drop the late result
+
+
+class ImageLoader(QObject):
+    """Decodes image files on the global thread pool.
+    QImage is safe to build off the GUI thread; receivers convert the
+    loaded image to a QPixmap back on the GUI thread. Loads still queued
+    when the app quits are cancelled."""
+    loaded = Signal(str, QImage)  # (path, image) - image is null on failure
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = {}  # (path, size) -> queued or running _ImageLoadTask
+        
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.cancel)
+    
+    def load(self, path, size=None):
+        """Start decoding path, optionally scaled down to fit size (QSize)
+        on the worker too; loaded is emitted when done. A load already
+        pending for the same path and size is not repeated."""
+        key = (path, None if size is None else (size.width(), size.height()))
+        if key in self._pending:
+            return
+        task = _ImageLoadTask(key, path, size)
+        task.signals.loaded.connect(self._on_task_loaded)
+        self._pending[key] = task
+        QThreadPool.globalInstance().start(task)
+    
+    def cancel(self):
+        """Drop loads that have not started yet"""
+        pool = QThreadPool.globalInstance()
+        for task in self._pending.values():
+            pool.tryTake(task)
+        self._pending.clear()
+    
+    @Slot(object, QImage)
+    def _on_task_loaded(self, key, image):
+        """Forward a finished decode (GUI thread)"""
+        self._pending.pop(key, None)
+        self.loaded.emit(key[0], image)
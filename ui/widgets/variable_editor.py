@@ -9,6 +9,9 @@ from PySide6.QtCore import Qt
 from .themed_widgets import ThemedLabel, ThemedScrollArea, ThemedLineEdit
 import re
 
+# L variables {L1} or {L1:default}; compiled once, update_variables runs per edit
+_L_VAR_RE = re.compile(r'\{(L\d+)(?::([^}]+))?\}')
+
 
 class VariableEditor(QWidget):
     """Resizable L variable editor"""
@@ -16,18 +19,13 @@ class VariableEditor(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.variables = {}  # var_name -> line_edit
+        self._row_pool = []  # (row, label, line_edit), reused across updates
+        self._last_defaults = None  # var_name -> default of the last update
         
+        # No stylesheet of its own: the rule it used to set never painted
+        # (plain QWidget subclass) and colors don't cascade to the rows, so
+        # the app stylesheet is what styles the editor and its children
         self.setup_ui()
-        self.apply_styling()
-    
-    def apply_styling(self):
-        """Apply Python-based styling"""
-        self.setStyleSheet("""
-            VariableEditor {
-                background-color: #282a36;
-                color: #ffffff;
-            }
-        """)
     
     def setup_ui(self):
         """Setup UI components"""
@@ -35,8 +33,7 @@ class VariableEditor(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Title
-        self.title_label = ThemedLabel("Variables (L)")
-        self.title_label.setStyleSheet("QLabel { font-weight: bold; padding: 5px; }")
+        self.title_label = ThemedLabel("Variables (L)", variant="title")
         layout.addWidget(self.title_label)
         
         # Scroll area - now resizable
@@ -46,37 +43,45 @@ class VariableEditor(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setMinimumHeight(100)  # Minimum height
         
-        # Container
+        # Container - no stylesheet of its own; the global theme's QWidget
+        # rule already paints it (and its rows) in the primary background
         container = QWidget()
-        container.setStyleSheet("QWidget { background-color: #1d1f28; }")
         self.vars_layout = QVBoxLayout(container)
         self.vars_layout.setSpacing(5)
         self.vars_layout.setContentsMargins(5, 5, 5, 5)
+        self.vars_layout.addStretch()  # Rows are inserted above it
         
         scroll.setWidget(container)
         layout.addWidget(scroll, 1)
     
     def _sort_l_variables(self, var_names):
         """Sort L variables numerically (L1, L2, L3, L10, L23, L150)"""
-        def extract_number(var_name):
-            # Extract the number from L variable name (e.g., "L10" -> 10)
-            match = re.match(r'L(\d+)', var_name)
-            return int(match.group(1)) if match else 0
+        # Names come from _L_VAR_RE, so they are "L" + digits ("L10" -> 10)
+        return sorted(var_names, key=lambda v: int(v[1:]) if v[1:].isdigit() else 0)
+    
+    def _make_row(self):
+        """Create a variable row (label + line edit) and add it to the pool"""
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        
+        label = ThemedLabel()
+        label.setFixedWidth(60)
+        row_layout.addWidget(label)
+        
+        line_edit = ThemedLineEdit()
+        line_edit.setPlaceholderText("Enter value...")
+        row_layout.addWidget(line_edit)
         
-        return sorted(var_names, key=extract_number)
+        self.vars_layout.insertWidget(self.vars_layout.count() - 1, row)
+        entry = (row, label, line_edit)
+        self._row_pool.append(entry)
+        return entry
     
     def update_variables(self, gcode):
         """Extract L variables from gcode and update UI"""
-        # Clear existing
-        while self.vars_layout.count():
-            item = self.vars_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self.variables.clear()
-        
         # Find L variables {L1} or {L1:default}
-        pattern = r'\{(L\d+)(?::([^}]+))?\}'
-        matches = re.findall(pattern, gcode)
+        matches = _L_VAR_RE.findall(gcode)
         
         # Create unique variables
         unique_vars = {}
@@ -84,32 +89,34 @@ class VariableEditor(QWidget):
             if var_name not in unique_vars:
                 unique_vars[var_name] = default
         
-        # Create editors - FIXED: Sort numerically instead of alphabetically
-        for var_name in self._sort_l_variables(unique_vars.keys()):
-            default = unique_vars[var_name]
-            
-            # Variable widget
-            var_widget = QWidget()
-            var_layout = QHBoxLayout(var_widget)
-            var_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # Label
-            label = ThemedLabel(f"{var_name}:")
-            label.setFixedWidth(60)
-            var_layout.addWidget(label)
-            
-            # Line edit
-            line_edit = ThemedLineEdit()
-            if default:
-                line_edit.setText(default)
-            line_edit.setPlaceholderText("Enter value...")
-            var_layout.addWidget(line_edit)
-            
-            self.vars_layout.addWidget(var_widget)
+        # Most edits don't touch the variables; leave the rows (and any
+        # values typed into them) alone unless a name or default changed
+        if unique_vars == self._last_defaults:
+            return
+        # Variables whose default is unchanged keep what the user typed
+        previous = self._last_defaults or {}
+        values = {name: line_edit.text() for name, line_edit in self.variables.items()
+                  if previous.get(name) == unique_vars.get(name)}
+        self._last_defaults = unique_vars
+        self.variables.clear()
+        
+        # Fill editors - FIXED: Sort numerically instead of alphabetically.
+        # Rows are relabelled in place; this runs per edit, and rebuilding
+        # every widget each time churned hundreds of QObjects
+        var_names = self._sort_l_variables(unique_vars.keys())
+        for index, var_name in enumerate(var_names):
+            if index < len(self._row_pool):
+                row, label, line_edit = self._row_pool[index]
+            else:
+                row, label, line_edit = self._make_row()
+            label.setText(f"{var_name}:")
+            line_edit.setText(values.get(var_name, unique_vars[var_name]))
+            row.show()
             self.variables[var_name] = line_edit
         
-        # Add stretch
-        self.vars_layout.addStretch()
+        # Park rows that are not needed this time
+        for row, _, _ in self._row_pool[len(var_names):]:
+            row.hide()
         
         # Update visibility
         self.setVisible(len(self.variables) > 0)
@@ -5,12 +5,10 @@ Second step in the wizard: Configure parameters and preview.
 Fully data-driven based on TabConfig.
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QSizePolicy, QScrollArea
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QScrollArea
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QDoubleValidator
 
-from ui.widgets import (ThemedSplitter, ThemedLabel, ThemedGroupBox, ThemedRadioButton,
-                        ThemedSpinBox, ClickableLabel, ScaledPreviewLabel)
+from ui.widgets import ThemedSplitter, ThemedGroupBox, ThemedRadioButton
 from ui.widgets.preview_widget import ShapePreviewWidget
 from ui.widgets.parameter_factory import SectionWidget
 from core.config_manager import TabConfig
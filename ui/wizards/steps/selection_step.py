@@ -61,8 +61,7 @@ class SelectionStep(QWidget):
         layout.addWidget(splitter, 1)
         
         # Bottom section - selection display
-        self.selection_label = ThemedLabel("Selected: None")
-        self.selection_label.setStyleSheet("QLabel { font-weight: bold; padding: 5px; }")
+        self.selection_label = ThemedLabel("Selected: None", variant="title")
         layout.addWidget(self.selection_label)
         
         self.update_selection_display()